@@ -0,0 +1,130 @@
+#!/usr/bin/env node
+// Measures verifyAdminToken on the paths that must not touch the backend:
+// cached verdicts, revoked tokens and expired tokens.
+//
+//   node scripts/auth-bench.mjs
+//   node scripts/auth-bench.mjs --tokens 10000 --rounds 20 --max-p99-us 1000
+//
+// A local stub answers verify-token once per token to warm the cache; every
+// timed call after that must be served in-process. The run fails when any
+// path's p99 exceeds --max-p99-us or when a timed call reaches the stub.
+
+import http from 'node:http';
+import { register } from 'node:module';
+import { parseArgs } from 'node:util';
+
+const { values: options } = parseArgs({
+  options: {
+    tokens: { type: 'string', default: '10000' },
+    rounds: { type: 'string', default: '20' },
+    'max-p99-us': { type: 'string', default: '1000' },
+  },
+});
+
+const tokenCount = Number(options.tokens);
+const rounds = Number(options.rounds);
+const maxP99Us = Number(options['max-p99-us']);
+
+// The services are written for Vite: relative imports omit '.js' and the API
+// base URL comes from import.meta.env. These hooks supply both under Node.
+register(`data:text/javascript,${encodeURIComponent(`
+  export async function resolve(specifier, context, next) {
+    if (/^\\.\\.?\\//.test(specifier) && !/\\.[cm]?js$/.test(specifier) && context.parentURL?.includes('/src/')) {
+      return next(specifier + '.js', context);
+    }
+    return next(specifier, context);
+  }
+  export async function load(url, context, next) {
+    const result = await next(url, context);
+    if (url.includes('/src/services/')) {
+      const source = String(result.source).replaceAll('import.meta.env', 'globalThis.__BENCH_ENV__');
+      return { ...result, source };
+    }
+    return result;
+  }
+`)}`);
+
+const store = new Map();
+globalThis.localStorage = {
+  getItem: (key) => (store.has(key) ? store.get(key) : null),
+  setItem: (key, value) => store.set(key, String(value)),
+  removeItem: (key) => store.delete(key),
+};
+globalThis.window = { location: { origin: 'http://localhost' } };
+
+let stubHits = 0;
+const server = http.createServer((req, res) => {
+  stubHits += 1;
+  req.resume();
+  req.on('end', () => {
+    res.writeHead(200, { 'Content-Type': 'application/json' });
+    res.end('{"valid":true}');
+  });
+});
+await new Promise((resolve) => server.listen(0, '127.0.0.1', resolve));
+globalThis.__BENCH_ENV__ = { VITE_API_BASE_URL: `http://127.0.0.1:${server.address().port}` };
+
+const { logoutAdmin, verifyAdminToken } = await import('../src/services/authService.js');
+
+const makeToken = (subject, expSeconds) => {
+  const encode = (value) => Buffer.from(JSON.stringify(value)).toString('base64url');
+  return `${encode({ alg: 'HS256', typ: 'JWT' })}.${encode({ sub: subject, exp: expSeconds })}.signature`;
+};
+
+const inAnHour = Math.floor(Date.now() / 1000) + 3600;
+const validTokens = Array.from({ length: tokenCount }, (_, i) => makeToken(`admin-${i}`, inAnHour));
+const expiredTokens = Array.from({ length: tokenCount }, (_, i) => makeToken(`expired-${i}`, 1));
+const revokedTokens = Array.from({ length: tokenCount }, (_, i) => makeToken(`revoked-${i}`, inAnHour));
+
+// Warm the cache: one backend verification per valid token, in batches.
+for (let i = 0; i < validTokens.length; i += 200) {
+  await Promise.all(validTokens.slice(i, i + 200).map((token) => verifyAdminToken(token)));
+}
+for (const token of revokedTokens) {
+  localStorage.setItem('adminToken', token);
+  logoutAdmin();
+}
+const warmHits = stubHits;
+
+const measure = async (tokens, expected) => {
+  const durations = [];
+  const startedAt = performance.now();
+  for (let round = 0; round < rounds; round += 1) {
+    for (const token of tokens) {
+      const callStartedAt = performance.now();
+      const valid = await verifyAdminToken(token);
+      durations.push(performance.now() - callStartedAt);
+      if (valid !== expected) throw new Error(`Unexpected verdict ${valid} for ${token}`);
+    }
+  }
+  const elapsedMs = performance.now() - startedAt;
+  durations.sort((a, b) => a - b);
+  const at = (p) => durations[Math.min(durations.length - 1, Math.ceil(p * durations.length) - 1)] * 1000;
+  return {
+    calls: durations.length,
+    'calls/s': Math.round(durations.length / (elapsedMs / 1000)),
+    'p50 µs': Number(at(0.5).toFixed(2)),
+    'p99 µs': Number(at(0.99).toFixed(2)),
+  };
+};
+
+const results = {
+  cached: await measure(validTokens, true),
+  revoked: await measure(revokedTokens, false),
+  expired: await measure(expiredTokens, false),
+};
+server.close();
+
+console.log(`${tokenCount} distinct tokens per path x ${rounds} rounds`);
+console.table(results);
+
+const failures = Object.entries(results)
+  .filter(([, result]) => result['p99 µs'] > maxP99Us)
+  .map(([path, result]) => `${path} p99 ${result['p99 µs']}µs exceeds ${maxP99Us}µs`);
+if (stubHits !== warmHits) {
+  failures.push(`${stubHits - warmHits} timed calls reached the backend`);
+}
+if (failures.length) {
+  console.error(failures.join('\n'));
+  process.exit(1);
+}
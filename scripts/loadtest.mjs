@@ -0,0 +1,274 @@
+#!/usr/bin/env node
+// Replays the request mixes the frontend generates against a backend and
+// reports throughput, error rate and p50/p95/p99 per route. Percentiles only
+// cover successful requests, so fast failures cannot make a route look quicker.
+//
+//   node scripts/loadtest.mjs --base-url http://localhost:5000 --scenario dashboard
+//   node scripts/loadtest.mjs --stub --stub-latency-ms 200 --scenario mixed
+//   node scripts/loadtest.mjs ... --save-baseline bench/baseline.json
+//   node scripts/loadtest.mjs ... --baseline bench/baseline.json --threshold 0.2
+//
+// With --stub a local server stands in for the backend and answers every route
+// after --stub-latency-ms, so the harness itself can be exercised offline.
+// Admin routes log in once up front with LOADTEST_ADMIN_USERNAME /
+// LOADTEST_ADMIN_PASSWORD; that setup call is not part of the results, and the
+// run stops if it fails.
+// A baseline records the scenario, users and iterations it was run with, and
+// is only compared against a run with the same settings. The comparison fails
+// on a latency regression beyond --threshold or on any rise in a route's
+// error rate.
+
+import http from 'node:http';
+import { readFile, writeFile } from 'node:fs/promises';
+import { parseArgs } from 'node:util';
+
+const { values: options } = parseArgs({
+  options: {
+    'base-url': { type: 'string', default: process.env.LOADTEST_BASE_URL || 'http://localhost:5000' },
+    scenario: { type: 'string', default: 'mixed' },
+    users: { type: 'string', default: '20' },
+    iterations: { type: 'string', default: '10' },
+    stub: { type: 'boolean', default: false },
+    'stub-latency-ms': { type: 'string', default: '50' },
+    baseline: { type: 'string' },
+    'save-baseline': { type: 'string' },
+    threshold: { type: 'string', default: '0.2' },
+  },
+});
+
+const users = Number(options.users);
+const iterations = Number(options.iterations);
+const threshold = Number(options.threshold);
+
+const settings = { scenario: options.scenario, users, iterations };
+
+// One id per run keeps emails unique across runs while letting a later
+// submission repeat an earlier one exactly.
+const runId = Date.now().toString(36);
+const registrationCounts = new Map();
+
+// Every tenth submission from a user repeats the email of the one sent nine
+// submissions earlier, as resubmissions do during a campaign.
+const nextRegistrationEmail = (user) => {
+  const sequence = registrationCounts.get(user) || 0;
+  registrationCounts.set(user, sequence + 1);
+  const emailSequence = sequence % 10 === 9 ? sequence - 9 : sequence;
+  return `loadtest-${runId}-${user}-${emailSequence}@example.com`;
+};
+
+const categories = ['agriculture', 'electronics', 'fashion', 'general'];
+const pick = (items) => items[Math.floor(Math.random() * items.length)];
+
+// Each step mirrors what a page does on mount or on a user action.
+const steps = {
+  tradeNews: () => ({ route: 'GET /api/ai/trade-news', path: `/api/ai/trade-news?count=${pick([3, 5])}` }),
+  marketInsights: () => ({ route: 'GET /api/ai/market-insights', path: `/api/ai/market-insights?topic=${pick(categories)}` }),
+  aiStatus: () => ({ route: 'GET /api/ai/status', path: '/api/ai/status' }),
+  autoGenerate: () => ({ route: 'POST /api/ai/auto-generate-content', path: '/api/ai/auto-generate-content', method: 'POST', body: {} }),
+  generateInsights: () => ({
+    route: 'POST /api/ai/generate-insights',
+    path: '/api/ai/generate-insights',
+    method: 'POST',
+    body: { category: pick(categories), count: 1 },
+  }),
+  adminLogin: () => ({
+    route: 'POST /api/auth/admin/login',
+    path: '/api/auth/admin/login',
+    method: 'POST',
+    body: {
+      username: process.env.LOADTEST_ADMIN_USERNAME || 'admin',
+      password: process.env.LOADTEST_ADMIN_PASSWORD || 'admin',
+    },
+  }),
+  verifyToken: (token) => ({
+    route: 'POST /api/auth/verify-token',
+    path: '/api/auth/verify-token',
+    method: 'POST',
+    headers: { Authorization: `Bearer ${token}` },
+  }),
+  partnerRegister: (_token, user) => ({
+    route: 'POST /api/auth/partner/register',
+    path: '/api/auth/partner/register',
+    method: 'POST',
+    body: {
+      company_name: `Load Test Co ${user}`,
+      contact_name: `Load Tester ${user}`,
+      email: nextRegistrationEmail(user),
+      phone: '+65 0000 0000',
+      country: 'Singapore',
+      business_type: 'Import/Export Company',
+      annual_revenue: '$1M - $5M',
+      experience: '3-5 years',
+      interests: 'Agriculture',
+      message: 'Load test application',
+    },
+  }),
+};
+
+const scenarios = {
+  // Home/News and PartnerDashboard mounting at the same moment.
+  dashboard: [['aiStatus', 'tradeNews', 'marketInsights'], ['verifyToken']],
+  // A partner campaign: mostly registrations, with landing-page reads.
+  registration: [['partnerRegister'], ['partnerRegister', 'tradeNews']],
+  mixed: [
+    ['aiStatus', 'tradeNews', 'marketInsights'],
+    ['verifyToken'],
+    ['partnerRegister'],
+    ['generateInsights'],
+    ['tradeNews'],
+    ['autoGenerate'],
+  ],
+};
+
+const startStub = (latencyMs) => new Promise((resolve) => {
+  const server = http.createServer((req, res) => {
+    req.resume();
+    req.on('end', () => setTimeout(() => {
+      const body = req.url.startsWith('/api/auth/admin/login')
+        ? { token: 'stub-token', user: { username: 'admin', email: 'admin@example.com' } }
+        : { articles: [], status: 'online' };
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify(body));
+    }, latencyMs));
+  });
+  server.listen(0, '127.0.0.1', () => resolve(server));
+});
+
+const samples = new Map();
+
+// Failed requests are counted but kept out of the latency samples.
+const record = (route, durationMs, ok) => {
+  if (!samples.has(route)) samples.set(route, { durations: [], errors: 0 });
+  const entry = samples.get(route);
+  if (ok) {
+    entry.durations.push(durationMs);
+  } else {
+    entry.errors += 1;
+  }
+};
+
+// Setup calls pass recorded = false so they stay out of the summary and the
+// regression gate.
+const send = async (baseUrl, { route, path, method = 'GET', headers = {}, body }, recorded = true) => {
+  const startedAt = performance.now();
+  let ok = false;
+  let result = null;
+  try {
+    const response = await fetch(`${baseUrl}${path}`, {
+      method,
+      headers: { 'Content-Type': 'application/json', ...headers },
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    result = await response.json().catch(() => null);
+    ok = response.ok;
+  } catch {
+    ok = false;
+  }
+  if (recorded) record(route, performance.now() - startedAt, ok);
+  return { ok, result };
+};
+
+// Null when every request to the route failed.
+const percentile = (sorted, p) => {
+  if (!sorted.length) return null;
+  const value = sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+  return Number(value.toFixed(1));
+};
+
+const summarize = (elapsedMs) => {
+  const summary = {};
+  for (const [route, { durations, errors }] of [...samples].sort(([a], [b]) => a.localeCompare(b))) {
+    const sorted = [...durations].sort((a, b) => a - b);
+    const requests = sorted.length + errors;
+    summary[route] = {
+      requests,
+      errors,
+      errorRate: Number((errors / requests).toFixed(4)),
+      rps: Number((requests / (elapsedMs / 1000)).toFixed(1)),
+      p50: percentile(sorted, 50),
+      p95: percentile(sorted, 95),
+      p99: percentile(sorted, 99),
+    };
+  }
+  return summary;
+};
+
+const compare = (summary, baseline) => {
+  const regressions = [];
+  for (const [route, current] of Object.entries(summary)) {
+    const previous = baseline.routes[route];
+    if (!previous) continue;
+    const previousErrorRate = previous.errorRate ?? 0;
+    if (current.errorRate > previousErrorRate) {
+      regressions.push(`${route} error rate: ${(previousErrorRate * 100).toFixed(2)}% -> ${(current.errorRate * 100).toFixed(2)}%`);
+    }
+    for (const metric of ['p50', 'p95', 'p99']) {
+      if (current[metric] === null || previous[metric] == null) continue;
+      if (current[metric] > previous[metric] * (1 + threshold)) {
+        regressions.push(`${route} ${metric}: ${previous[metric]}ms -> ${current[metric]}ms`);
+      }
+    }
+  }
+  return regressions;
+};
+
+const main = async () => {
+  const scenario = scenarios[options.scenario];
+  if (!scenario) {
+    console.error(`Unknown scenario "${options.scenario}". Choose one of: ${Object.keys(scenarios).join(', ')}`);
+    process.exit(2);
+  }
+
+  const stub = options.stub ? await startStub(Number(options['stub-latency-ms'])) : null;
+  const baseUrl = stub ? `http://127.0.0.1:${stub.address().port}` : options['base-url'].replace(/\/$/, '');
+
+  const needsToken = scenario.some((phase) => phase.includes('verifyToken'));
+  const login = needsToken ? await send(baseUrl, steps.adminLogin(), false) : null;
+  const token = (login?.ok && login.result?.token) || '';
+  // Without a token every verify-token request would fail and be measured as
+  // a fast rejection, so there is nothing worth comparing.
+  if (needsToken && !token) {
+    console.error(`Admin login against ${baseUrl} failed; check LOADTEST_ADMIN_USERNAME / LOADTEST_ADMIN_PASSWORD.`);
+    stub?.close();
+    process.exit(1);
+  }
+
+  console.log(`Running "${options.scenario}" against ${baseUrl}: ${users} users x ${iterations} iterations`);
+  const startedAt = performance.now();
+  await Promise.all(Array.from({ length: users }, async (_, user) => {
+    for (let iteration = 0; iteration < iterations; iteration += 1) {
+      // Steps within a phase run concurrently, as a page's mount effects do.
+      for (const phase of scenario) {
+        await Promise.all(phase.map((name) => send(baseUrl, steps[name](token, user))));
+      }
+    }
+  }));
+  const summary = summarize(performance.now() - startedAt);
+  stub?.close();
+
+  console.table(summary);
+
+  if (options['save-baseline']) {
+    await writeFile(options['save-baseline'], `${JSON.stringify({ settings, routes: summary }, null, 2)}\n`);
+    console.log(`Baseline written to ${options['save-baseline']}`);
+  }
+
+  if (options.baseline) {
+    const baseline = JSON.parse(await readFile(options.baseline, 'utf8'));
+    // Latencies are only comparable under the same load shape.
+    const mismatched = Object.keys(settings).filter((key) => baseline.settings?.[key] !== settings[key]);
+    if (mismatched.length) {
+      console.error(`Baseline ${options.baseline} was recorded with different settings `
+        + `(${mismatched.map((key) => `${key}: ${baseline.settings?.[key]} vs ${settings[key]}`).join(', ')}); not comparing.`);
+      process.exit(2);
+    }
+    const regressions = compare(summary, baseline);
+    if (regressions.length) {
+      console.error(`Regressions against ${options.baseline} (latency threshold ${threshold * 100}%):\n  ${regressions.join('\n  ')}`);
+      process.exit(1);
+    }
+    console.log(`No latency regressions beyond ${threshold * 100}% and no error-rate increase against ${options.baseline}`);
+  }
+};
+
+main();
@@ -0,0 +1,101 @@
+#!/usr/bin/env node
+// Measures what the request instrumentation in src/services/metrics.js adds to
+// an API call, with and without recording, against a local stub server.
+//
+//   node scripts/metrics-bench.mjs
+//   node scripts/metrics-bench.mjs --requests 2000 --stub-latency-ms 0 --max-overhead 2
+//
+// Two numbers are reported:
+//   - end-to-end: the same request loop with and without the recording calls
+//     httpClient makes per attempt, in alternating rounds. This is the direct
+//     comparison but is subject to network-timing noise.
+//   - estimated: the cost of one recording (measured in a tight loop) as a
+//     share of the median request time. This is stable, and is what
+//     --max-overhead (percent) gates on.
+
+import http from 'node:http';
+import { parseArgs } from 'node:util';
+import { incrementCounter, observeLatency } from '../src/services/metrics.js';
+
+const { values: options } = parseArgs({
+  options: {
+    requests: { type: 'string', default: '1000' },
+    rounds: { type: 'string', default: '5' },
+    'stub-latency-ms': { type: 'string', default: '0' },
+    'max-overhead': { type: 'string', default: '2' },
+  },
+});
+
+const requests = Number(options.requests);
+const rounds = Number(options.rounds);
+const latencyMs = Number(options['stub-latency-ms']);
+const maxOverhead = Number(options['max-overhead']);
+
+const server = http.createServer((req, res) => {
+  req.resume();
+  req.on('end', () => setTimeout(() => {
+    res.writeHead(200, { 'Content-Type': 'application/json' });
+    res.end('{"status":"online"}');
+  }, latencyMs));
+});
+await new Promise((resolve) => server.listen(0, '127.0.0.1', resolve));
+const url = `http://127.0.0.1:${server.address().port}/api/ai/status`;
+
+// Mirrors the per-attempt work httpClient.request does when instrumented.
+const record = (startedAt, status) => {
+  const route = new URL(url).pathname;
+  observeLatency('http_client_request_duration_milliseconds', { route, method: 'GET', status }, performance.now() - startedAt);
+  incrementCounter('bench_requests_total', { route });
+};
+
+const runLoop = async (instrumented) => {
+  const durations = [];
+  const startedAt = performance.now();
+  for (let i = 0; i < requests; i += 1) {
+    const requestStartedAt = performance.now();
+    const response = await fetch(url);
+    await response.text();
+    if (instrumented) record(requestStartedAt, response.status);
+    durations.push(performance.now() - requestStartedAt);
+  }
+  return { total: performance.now() - startedAt, durations };
+};
+
+const median = (values) => {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+};
+
+// Warm up connections and the JIT before measuring.
+await runLoop(true);
+
+const plain = [];
+const instrumented = [];
+const durations = [];
+for (let round = 0; round < rounds; round += 1) {
+  const withoutMetrics = await runLoop(false);
+  const withMetrics = await runLoop(true);
+  plain.push(withoutMetrics.total);
+  instrumented.push(withMetrics.total);
+  durations.push(...withoutMetrics.durations);
+}
+server.close();
+
+const recordings = 200000;
+const recordStartedAt = performance.now();
+for (let i = 0; i < recordings; i += 1) record(performance.now(), 200);
+const recordCostMs = (performance.now() - recordStartedAt) / recordings;
+
+const endToEnd = ((median(instrumented) - median(plain)) / median(plain)) * 100;
+const estimated = (recordCostMs / median(durations)) * 100;
+
+console.log(`requests per loop:       ${requests} x ${rounds} rounds`);
+console.log(`median request:          ${(median(durations) * 1000).toFixed(1)} µs`);
+console.log(`cost per recording:      ${(recordCostMs * 1000).toFixed(2)} µs`);
+console.log(`end-to-end overhead:     ${endToEnd.toFixed(2)}% (noisy)`);
+console.log(`estimated overhead:      ${estimated.toFixed(2)}% (limit ${maxOverhead}%)`);
+
+if (estimated > maxOverhead) {
+  console.error(`Instrumentation overhead ${estimated.toFixed(2)}% exceeds ${maxOverhead}%`);
+  process.exit(1);
+}
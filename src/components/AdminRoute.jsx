@@ -0,0 +1,33 @@
+import { useEffect } from 'react';
+import { useNavigate } from 'react-router-dom';
+import { clearAdminSession, getAdminToken, verifyAdminToken } from '../services/authService';
+
+// Wraps admin-only pages: redirects to the login page when there is no token
+// or the backend rejects it. Verification results are cached per token, so
+// remounting a protected page does not hit the backend again.
+const AdminRoute = ({ children }) => {
+  const navigate = useNavigate();
+  const adminToken = getAdminToken();
+
+  useEffect(() => {
+    if (!adminToken) {
+      navigate('/admin-login');
+      return;
+    }
+
+    let cancelled = false;
+    verifyAdminToken(adminToken).then((valid) => {
+      if (!valid && !cancelled) {
+        clearAdminSession();
+        navigate('/admin-login');
+      }
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [adminToken, navigate]);
+
+  return adminToken ? children : null;
+};
+
+export default AdminRoute;
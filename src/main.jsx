@@ -2,9 +2,19 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.jsx'
+import { startApplicationOutbox } from './services/partnerService'
+import { markStartup, toPrometheusText } from './services/metrics'
+
+markStartup('modules_loaded')
+
+window.__BZTRADEWAVE_METRICS__ = { toPrometheusText }
+
+startApplicationOutbox()
 
 createRoot(document.getElementById('root')).render(
   <StrictMode>
     <App />
   </StrictMode>,
 )
+
+requestAnimationFrame(() => markStartup('first_render'))
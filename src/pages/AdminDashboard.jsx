@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useMemo, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -6,6 +6,7 @@ import { Badge } from '@/components/ui/badge';
 import { Input } from '@/components/ui/input';
 import { Textarea } from '@/components/ui/textarea';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
+import { logoutAdmin } from '../services/authService';
 import { 
   BarChart, 
   Bar, 
@@ -43,94 +44,164 @@ import {
   DollarSign
 } from 'lucide-react';
 
+const APPLICATIONS_PAGE_SIZE = 20;
+
+// Sample data
+const partnerApplications = [
+  {
+    id: 1,
+    companyName: 'Global Trade Solutions',
+    contactName: 'John Smith',
+    email: 'john@globaltrade.com',
+    country: 'Singapore',
+    businessType: 'Import/Export Company',
+    status: 'pending',
+    submittedDate: '2025-08-28',
+    revenue: '$5M - $10M'
+  },
+  {
+    id: 2,
+    companyName: 'Tech Innovations Ltd',
+    contactName: 'Sarah Johnson',
+    email: 'sarah@techinnovations.com',
+    country: 'United Kingdom',
+    businessType: 'Technology Services',
+    status: 'approved',
+    submittedDate: '2025-08-25',
+    revenue: '$10M - $50M'
+  },
+  {
+    id: 3,
+    companyName: 'Fashion Forward Co',
+    contactName: 'Mike Chen',
+    email: 'mike@fashionforward.com',
+    country: 'China',
+    businessType: 'Fashion/Textiles',
+    status: 'rejected',
+    submittedDate: '2025-08-20',
+    revenue: '$1M - $5M'
+  }
+];
+
+// Per-status totals rolled up in a single pass. The overview stat and the
+// status filter read from this instead of each re-filtering the list. The
+// applications carry no history, so the pending stat shows no trend.
+const applicationStatusCounts = partnerApplications.reduce((counts, application) => {
+  counts[application.status] = (counts[application.status] || 0) + 1;
+  return counts;
+}, {});
+
+// Overview series live at module scope so the charts receive the same arrays
+// on every render instead of freshly allocated copies.
+const systemStats = [
+  { label: 'Total Partners', value: '150', change: '+12', icon: Users, color: 'text-blue-600' },
+  { label: 'Pending Applications', value: String(applicationStatusCounts.pending || 0), icon: Clock, color: 'text-yellow-600' },
+  { label: 'Total Trade Volume', value: '$17M', change: '+15%', icon: DollarSign, color: 'text-green-600' },
+  { label: 'Active Countries', value: '25', change: '+2', icon: Globe, color: 'text-purple-600' }
+];
+
+const tradeVolumeData = [
+  { month: 'Jan', volume: 12000 },
+  { month: 'Feb', volume: 15000 },
+  { month: 'Mar', volume: 18000 },
+  { month: 'Apr', volume: 16000 },
+  { month: 'May', volume: 20000 },
+  { month: 'Jun', volume: 22000 }
+];
+
+const partnersByRegion = [
+  { name: 'Asia-Pacific', value: 45, color: '#3B82F6' },
+  { name: 'Europe', value: 30, color: '#10B981' },
+  { name: 'North America', value: 15, color: '#F59E0B' },
+  { name: 'Others', value: 10, color: '#8B5CF6' }
+];
+
+const APPLICATION_CSV_COLUMNS = [
+  'id',
+  'companyName',
+  'contactName',
+  'email',
+  'country',
+  'businessType',
+  'status',
+  'submittedDate',
+  'revenue'
+];
+
+// Lowercased word tokens per application, built once, so each keystroke in the
+// search box is a prefix scan instead of re-lowercasing every field.
+const buildApplicationIndex = (applications) => applications.map((application) => {
+  const email = application.email.toLowerCase();
+  const words = `${application.companyName} ${application.contactName} ${email}`
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+  return { application, tokens: [...words, email] };
+});
+
+const applicationIndex = buildApplicationIndex(partnerApplications);
+
+const applicationCountries = [...new Set(partnerApplications.map((application) => application.country))].sort();
+const applicationBusinessTypes = [...new Set(partnerApplications.map((application) => application.businessType))].sort();
+
+// Partner-submitted text starting with one of these would be evaluated as a
+// formula when the export is opened in a spreadsheet, so it is prefixed with '.
+const CSV_FORMULA_PREFIX = /^[=+\-@\t\r]/;
+
+const toCsvCell = (value) => {
+  const text = String(value ?? '');
+  const safe = CSV_FORMULA_PREFIX.test(text) ? `'${text}` : text;
+  return `"${safe.replace(/"/g, '""')}"`;
+};
+
+// The Blob is assembled from one string per row rather than a single
+// concatenated string, which keeps large exports cheap.
+const downloadApplicationsCsv = (applications) => {
+  const rows = [
+    `${APPLICATION_CSV_COLUMNS.join(',')}\n`,
+    ...applications.map((application) => `${APPLICATION_CSV_COLUMNS.map((column) => toCsvCell(application[column])).join(',')}\n`)
+  ];
+  const url = URL.createObjectURL(new Blob(rows, { type: 'text/csv' }));
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = 'partner-applications.csv';
+  link.click();
+  // Revoking synchronously can cancel the download in some browsers.
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+};
+
 const AdminDashboard = () => {
   const [activeTab, setActiveTab] = useState('overview');
   const [searchTerm, setSearchTerm] = useState('');
+  const [statusFilter, setStatusFilter] = useState('all');
+  const [countryFilter, setCountryFilter] = useState('all');
+  const [businessTypeFilter, setBusinessTypeFilter] = useState('all');
+  const [visibleApplications, setVisibleApplications] = useState(APPLICATIONS_PAGE_SIZE);
   const navigate = useNavigate();
 
-  // Check authentication on component mount
-  useEffect(() => {
-    const isAuthenticated = localStorage.getItem('adminAuthenticated');
-    const adminToken = localStorage.getItem('adminToken');
-    
-    if (!isAuthenticated || isAuthenticated !== 'true' || !adminToken) {
-      navigate('/admin-login');
-      return;
-    }
-    
-    // Verify token with backend
-    const verifyToken = async () => {
-      try {
-        const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://bztrade.onrender.com';
-        
-        const response = await fetch(`${API_BASE_URL}/api/auth/verify-token`, {
-          method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${adminToken}`,
-            'Content-Type': 'application/json'
-          }
-        });
-        
-        if (!response.ok) {
-          // Token is invalid, redirect to login
-          localStorage.removeItem('adminAuthenticated');
-          localStorage.removeItem('adminToken');
-          localStorage.removeItem('adminUser');
-          navigate('/admin-login');
-        }
-      } catch (error) {
-        console.error('Token verification failed:', error);
-        // On network error, allow access but log the issue
-      }
-    };
-    
-    verifyToken();
-  }, [navigate]);
+  const filteredApplications = useMemo(() => {
+    const terms = searchTerm.toLowerCase().split(/\s+/).filter(Boolean);
+    return applicationIndex
+      .filter(({ application, tokens }) => (
+        (statusFilter === 'all' || application.status === statusFilter) &&
+        (countryFilter === 'all' || application.country === countryFilter) &&
+        (businessTypeFilter === 'all' || application.businessType === businessTypeFilter) &&
+        terms.every((term) => tokens.some((token) => token.startsWith(term)))
+      ))
+      .map(({ application }) => application);
+  }, [searchTerm, statusFilter, countryFilter, businessTypeFilter]);
+
+  // Any change to the query starts again from the first page.
+  const updateApplicationQuery = (setter) => (value) => {
+    setter(value);
+    setVisibleApplications(APPLICATIONS_PAGE_SIZE);
+  };
 
   const handleLogout = () => {
-    localStorage.removeItem('adminAuthenticated');
-    localStorage.removeItem('adminToken');
-    localStorage.removeItem('adminUser');
+    logoutAdmin();
     navigate('/admin-login');
   };
 
-  // Sample data
-  const partnerApplications = [
-    {
-      id: 1,
-      companyName: 'Global Trade Solutions',
-      contactName: 'John Smith',
-      email: 'john@globaltrade.com',
-      country: 'Singapore',
-      businessType: 'Import/Export Company',
-      status: 'pending',
-      submittedDate: '2025-08-28',
-      revenue: '$5M - $10M'
-    },
-    {
-      id: 2,
-      companyName: 'Tech Innovations Ltd',
-      contactName: 'Sarah Johnson',
-      email: 'sarah@techinnovations.com',
-      country: 'United Kingdom',
-      businessType: 'Technology Services',
-      status: 'approved',
-      submittedDate: '2025-08-25',
-      revenue: '$10M - $50M'
-    },
-    {
-      id: 3,
-      companyName: 'Fashion Forward Co',
-      contactName: 'Mike Chen',
-      email: 'mike@fashionforward.com',
-      country: 'China',
-      businessType: 'Fashion/Textiles',
-      status: 'rejected',
-      submittedDate: '2025-08-20',
-      revenue: '$1M - $5M'
-    }
-  ];
-
   const activePartners = [
     {
       id: 1,
@@ -154,29 +225,6 @@ const AdminDashboard = () => {
     }
   ];
 
-  const systemStats = [
-    { label: 'Total Partners', value: '150', change: '+12', icon: Users, color: 'text-blue-600' },
-    { label: 'Pending Applications', value: '8', change: '+3', icon: Clock, color: 'text-yellow-600' },
-    { label: 'Total Trade Volume', value: '$17M', change: '+15%', icon: DollarSign, color: 'text-green-600' },
-    { label: 'Active Countries', value: '25', change: '+2', icon: Globe, color: 'text-purple-600' }
-  ];
-
-  const tradeVolumeData = [
-    { month: 'Jan', volume: 12000 },
-    { month: 'Feb', volume: 15000 },
-    { month: 'Mar', volume: 18000 },
-    { month: 'Apr', volume: 16000 },
-    { month: 'May', volume: 20000 },
-    { month: 'Jun', volume: 22000 }
-  ];
-
-  const partnersByRegion = [
-    { name: 'Asia-Pacific', value: 45, color: '#3B82F6' },
-    { name: 'Europe', value: 30, color: '#10B981' },
-    { name: 'North America', value: 15, color: '#F59E0B' },
-    { name: 'Others', value: 10, color: '#8B5CF6' }
-  ];
-
   const getStatusColor = (status) => {
     switch (status) {
       case 'approved': return 'bg-green-100 text-green-800';
@@ -209,10 +257,12 @@ const AdminDashboard = () => {
                 </div>
                 <stat.icon className={`h-8 w-8 ${stat.color}`} />
               </div>
-              <div className="flex items-center mt-2">
-                <TrendingUp className="h-4 w-4 text-green-600 mr-1" />
-                <span className="text-sm text-green-600">{stat.change}</span>
-              </div>
+              {stat.change && (
+                <div className="flex items-center mt-2">
+                  <TrendingUp className="h-4 w-4 text-green-600 mr-1" />
+                  <span className="text-sm text-green-600">{stat.change}</span>
+                </div>
+              )}
             </CardContent>
           </Card>
         ))}
@@ -309,17 +359,67 @@ const AdminDashboard = () => {
               <CardDescription>Review and manage partnership applications</CardDescription>
             </div>
             <div className="flex space-x-2">
-              <Input placeholder="Search applications..." className="w-64" />
-              <Button variant="outline">
-                <Filter className="h-4 w-4 mr-2" />
-                Filter
+              <Input
+                placeholder="Search applications..."
+                className="w-64"
+                value={searchTerm}
+                onChange={(e) => updateApplicationQuery(setSearchTerm)(e.target.value)}
+              />
+              <Button variant="outline" onClick={() => downloadApplicationsCsv(filteredApplications)}>
+                <Download className="h-4 w-4 mr-2" />
+                Export CSV
               </Button>
             </div>
           </div>
+          <div className="flex flex-wrap gap-2 pt-4">
+            <Filter className="h-4 w-4 mt-2.5 text-muted-foreground" />
+            <Select value={statusFilter} onValueChange={updateApplicationQuery(setStatusFilter)}>
+              <SelectTrigger className="w-40">
+                <SelectValue placeholder="Status" />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="all">All Statuses ({partnerApplications.length})</SelectItem>
+                <SelectItem value="pending">Pending ({applicationStatusCounts.pending || 0})</SelectItem>
+                <SelectItem value="approved">Approved ({applicationStatusCounts.approved || 0})</SelectItem>
+                <SelectItem value="rejected">Rejected ({applicationStatusCounts.rejected || 0})</SelectItem>
+              </SelectContent>
+            </Select>
+            <Select value={countryFilter} onValueChange={updateApplicationQuery(setCountryFilter)}>
+              <SelectTrigger className="w-48">
+                <SelectValue placeholder="Country" />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="all">All Countries</SelectItem>
+                {applicationCountries.map((country) => (
+                  <SelectItem key={country} value={country}>
+                    {country}
+                  </SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
+            <Select value={businessTypeFilter} onValueChange={updateApplicationQuery(setBusinessTypeFilter)}>
+              <SelectTrigger className="w-56">
+                <SelectValue placeholder="Business Type" />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="all">All Business Types</SelectItem>
+                {applicationBusinessTypes.map((type) => (
+                  <SelectItem key={type} value={type}>
+                    {type}
+                  </SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
+          </div>
         </CardHeader>
         <CardContent>
           <div className="space-y-4">
-            {partnerApplications.map((application) => (
+            {filteredApplications.length === 0 && (
+              <p className="text-sm text-muted-foreground text-center py-8">
+                No applications match your search.
+              </p>
+            )}
+            {filteredApplications.slice(0, visibleApplications).map((application) => (
               <Card key={application.id} className="border-l-4 border-l-blue-500">
                 <CardContent className="p-6">
                   <div className="flex items-center justify-between mb-4">
@@ -383,6 +483,16 @@ const AdminDashboard = () => {
               </Card>
             ))}
           </div>
+          {filteredApplications.length > visibleApplications && (
+            <div className="flex justify-center pt-4">
+              <Button
+                variant="outline"
+                onClick={() => setVisibleApplications((count) => count + APPLICATIONS_PAGE_SIZE)}
+              >
+                Load more ({filteredApplications.length - visibleApplications} remaining)
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
     </div>
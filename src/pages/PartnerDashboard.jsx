@@ -41,7 +41,6 @@ const PartnerDashboard = () => {
   const [user, setUser] = useState(null);
   const [activeTab, setActiveTab] = useState('overview');
   const [message, setMessage] = useState('');
-  const [aiRecommendations, setAiRecommendations] = useState(null);
   const [aiInsights, setAiInsights] = useState(null);
   const [isLoadingAI, setIsLoadingAI] = useState(false);
   const navigate = useNavigate();
@@ -64,20 +63,20 @@ const PartnerDashboard = () => {
     }
   }, [navigate]);
 
+  // Insights refreshed in this or any other tab arrive here without a re-fetch.
+  useEffect(() => {
+    if (!user) return undefined;
+    const topic = user.industry || 'general';
+    return aiService.subscribeToContentUpdates((update) => {
+      if (update.type === 'market-insights' && update.topic === topic) {
+        setAiInsights(aiService.formatInsightsForDisplay(update.data));
+      }
+    });
+  }, [user]);
+
   const loadAIContent = async (userData) => {
     setIsLoadingAI(true);
     try {
-      // Get personalized recommendations
-      const userProfile = {
-        industry: userData.industry || 'General',
-        experience: userData.experience || 'Intermediate',
-        regions: userData.regions || 'Asia-Pacific',
-        business_size: userData.business_size || 'Medium'
-      };
-      
-      const recommendations = await aiService.getTradeRecommendations(userProfile);
-      setAiRecommendations(recommendations);
-
       // Get market insights for user's industry
       const insights = await aiService.getMarketInsights(userData.industry || 'general');
       setAiInsights(aiService.formatInsightsForDisplay(insights));
@@ -298,6 +297,22 @@ const PartnerDashboard = () => {
 
   const renderInsights = () => (
     <div className="space-y-6">
+      {isLoadingAI && (
+        <p className="text-sm text-muted-foreground">Loading AI insights...</p>
+      )}
+      {aiInsights && !aiInsights.isError && (
+        <Card className="ai-glow">
+          <CardHeader>
+            <CardTitle>{aiInsights.title}</CardTitle>
+            <CardDescription>
+              {aiInsights.source} • {new Date(aiInsights.timestamp).toLocaleString()}
+            </CardDescription>
+          </CardHeader>
+          <CardContent>
+            <p className="text-sm text-muted-foreground whitespace-pre-line">{aiInsights.content}</p>
+          </CardContent>
+        </Card>
+      )}
       <Card>
         <CardHeader>
           <CardTitle>AI-Powered Market Insights</CardTitle>
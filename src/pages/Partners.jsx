@@ -7,6 +7,7 @@ import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
 import { Textarea } from '@/components/ui/textarea';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
+import { submitPartnerApplication } from '../services/partnerService';
 import { 
   Users, 
   Globe, 
@@ -59,49 +60,28 @@ const Partners = () => {
     setIsSubmitting(true);
     
     try {
-      const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://bztrade.onrender.com';
-      
-      const response = await fetch(`${API_BASE_URL}/api/auth/partner/register`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          company_name: formData.companyName,
-          contact_name: formData.contactName,
-          email: formData.email,
-          phone: formData.phone,
-          country: formData.country,
-          business_type: formData.businessType,
-          annual_revenue: formData.annualRevenue,
-          experience: formData.experience,
-          interests: formData.interests,
-          message: formData.message
-        })
-      });
+      const result = await submitPartnerApplication(formData);
 
-      const result = await response.json();
-      
-      if (response.ok) {
-        alert('Thank you for your partnership application! We will review your submission and contact you within 48 hours.');
-        setFormData({
-          companyName: '',
-          contactName: '',
-          email: '',
-          phone: '',
-          country: '',
-          businessType: '',
-          annualRevenue: '',
-          experience: '',
-          interests: '',
-          message: ''
-        });
-      } else {
-        alert(`Error: ${result.error || 'Failed to submit application. Please try again.'}`);
+      if (result.error) {
+        alert(`Error: ${result.error}`);
+        return;
       }
-    } catch (error) {
-      console.error('Error submitting form:', error);
-      alert('Failed to submit application. Please check your connection and try again.');
+
+      alert(result.queued
+        ? 'Thank you for your partnership application! Our servers could not be reached just now, so we have saved it and will keep retrying automatically while you are on the site.'
+        : 'Thank you for your partnership application! We will review your submission and contact you within 48 hours.');
+      setFormData({
+        companyName: '',
+        contactName: '',
+        email: '',
+        phone: '',
+        country: '',
+        businessType: '',
+        annualRevenue: '',
+        experience: '',
+        interests: '',
+        message: ''
+      });
     } finally {
       setIsSubmitting(false);
     }
@@ -1,26 +1,160 @@
+import { createRequestCache } from './requestCache';
+import { CircuitOpenError, isCircuitOpen, request } from './httpClient';
+
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://5000-i9worpvlecsk8tpur3owu-78751ae2.manusvm.computer';
 
+const TRADE_NEWS_TTL_MS = 5 * 60 * 1000;
+
+// Market insights and generated insights are requested for the same handful
+// of topics on every dashboard load.
+const marketInsightsCache = createRequestCache({ maxEntries: 50, ttlMs: 10 * 60 * 1000 });
+const generatedInsightsCache = createRequestCache({ maxEntries: 50, ttlMs: 10 * 60 * 1000 });
+
+// Market-insight topics this tab has shown, re-fetched after a refresh.
+const marketInsightTopics = new Set();
+
+// Last trade-news payload. Smaller counts are served as slices of it, and a
+// stale entry is returned immediately while a single revalidation runs.
+const tradeNewsCache = {
+  data: null,
+  count: 0,
+  fetchedAt: 0,
+  pending: null,
+  pendingCount: 0,
+};
+
+// All open tabs share one channel, and each tab has a single handler that fans
+// updates out to its local subscribers. New content therefore costs one message
+// per tab, however many components are listening, instead of a re-fetch in
+// every tab.
+const contentChannel = typeof BroadcastChannel === 'undefined'
+  ? null
+  : new BroadcastChannel('bztradewave-ai-content');
+const contentSubscribers = new Set();
+
+// A smaller payload would shrink the cache and push larger requests back to
+// the backend, so it only replaces a local entry that has already gone stale.
+const shouldReplaceTradeNews = (update) => !tradeNewsCache.data
+  || update.count >= tradeNewsCache.count
+  || update.fetchedAt - tradeNewsCache.fetchedAt > TRADE_NEWS_TTL_MS;
+
+const applyContentUpdate = (update) => {
+  if (update.type === 'trade-news') {
+    if (shouldReplaceTradeNews(update)) {
+      tradeNewsCache.data = update.data;
+      tradeNewsCache.count = update.count;
+      tradeNewsCache.fetchedAt = update.fetchedAt;
+    }
+  } else if (update.type === 'market-insights') {
+    marketInsightsCache.set(['market-insights', update.topic], update.data);
+  } else if (update.type === 'generated-insights-invalidated') {
+    generatedInsightsCache.clear();
+  }
+  contentSubscribers.forEach((subscriber) => {
+    try {
+      subscriber(update);
+    } catch (error) {
+      console.error("Error handling AI content update:", error);
+    }
+  });
+};
+
+const publishContentUpdate = (update) => {
+  applyContentUpdate(update);
+  contentChannel?.postMessage(update);
+};
+
+if (contentChannel) {
+  contentChannel.onmessage = (event) => applyContentUpdate(event.data);
+}
+
+const sliceTradeNews = (data, count) => ({
+  ...data,
+  articles: data.articles.slice(0, count),
+});
+
+const fetchTradeNews = (requestCount) => request(`${API_BASE_URL}/api/ai/trade-news?count=${requestCount}`, {
+  policy: 'aiRead',
+  // 'no-cache' makes the browser revalidate with the stored ETag /
+  // Last-Modified, so an unchanged feed comes back as a 304 without a body
+  // and without the CORS preflight that hand-written conditional headers
+  // would trigger.
+  cache: 'no-cache',
+})
+  .then(async (response) => {
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    const data = await response.json();
+    if (Array.isArray(data?.articles)) {
+      publishContentUpdate({
+        type: 'trade-news',
+        data,
+        count: requestCount,
+        fetchedAt: Date.now(),
+      });
+    }
+    return data;
+  });
+
+const revalidateTradeNews = (count) => {
+  // Join the fetch in flight only if it asked for enough articles; otherwise
+  // queue a larger one behind it.
+  if (tradeNewsCache.pending && tradeNewsCache.pendingCount >= count) {
+    return tradeNewsCache.pending;
+  }
+
+  const requestCount = Math.max(count, tradeNewsCache.count);
+  const previous = tradeNewsCache.pending || Promise.resolve();
+  const pending = previous
+    .catch(() => {})
+    .then(() => fetchTradeNews(requestCount))
+    .finally(() => {
+      if (tradeNewsCache.pending === pending) {
+        tradeNewsCache.pending = null;
+        tradeNewsCache.pendingCount = 0;
+      }
+    });
+  tradeNewsCache.pending = pending;
+  tradeNewsCache.pendingCount = requestCount;
+  return pending;
+};
+
+const fetchMarketInsights = async (topic) => {
+  const response = await request(`${API_BASE_URL}/api/ai/market-insights?topic=${topic}`, {
+    policy: 'aiRead',
+  });
+  if (!response.ok) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+  return await response.json();
+};
+
 const aiService = {
   async getTradeNews(count = 3) {
-    try {
-      const response = await fetch(`${API_BASE_URL}/api/ai/trade-news?count=${count}`);
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
+    const cached = tradeNewsCache.data;
+    if (cached && tradeNewsCache.count >= count) {
+      if (Date.now() - tradeNewsCache.fetchedAt > TRADE_NEWS_TTL_MS) {
+        revalidateTradeNews(count).catch((error) => {
+          console.error("Error revalidating AI trade news:", error);
+        });
       }
-      return await response.json();
+      return sliceTradeNews(cached, count);
+    }
+
+    try {
+      const data = await revalidateTradeNews(count);
+      return Array.isArray(data?.articles) ? sliceTradeNews(data, count) : data;
     } catch (error) {
       console.error("Error fetching AI trade news:", error);
-      return { articles: [] };
+      return cached ? sliceTradeNews(cached, count) : { articles: [] };
     }
   },
 
   async getMarketInsights(topic = 'general') {
+    marketInsightTopics.add(topic);
     try {
-      const response = await fetch(`${API_BASE_URL}/api/ai/market-insights?topic=${topic}`);
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      return await response.json();
+      return await marketInsightsCache.get(['market-insights', topic], () => fetchMarketInsights(topic));
     } catch (error) {
       console.error("Error fetching AI market insights:", error);
       return { title: "AI Insights Unavailable", content: "Failed to load AI market insights. Please try again later.", isError: true };
@@ -28,13 +162,22 @@ const aiService = {
   },
 
   async checkAIStatus() {
+    // Report a tripped breaker straight away instead of waiting on a provider
+    // that is already known to be failing.
+    if (isCircuitOpen('ai')) {
+      return { status: "degraded" };
+    }
     try {
-      const response = await fetch(`${API_BASE_URL}/api/ai/status`);
+      const response = await request(`${API_BASE_URL}/api/ai/status`, { policy: 'aiStatus' });
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       return await response.json();
     } catch (error) {
+      // The breaker can trip between the check above and this request.
+      if (error instanceof CircuitOpenError) {
+        return { status: "degraded" };
+      }
       console.error("Error checking AI status:", error);
       return { status: "offline" };
     }
@@ -42,7 +185,8 @@ const aiService = {
 
   async refreshAIContent() {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/ai/auto-generate-content`, {
+      const response = await request(`${API_BASE_URL}/api/ai/auto-generate-content`, {
+        policy: 'aiGenerate',
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -51,7 +195,23 @@ const aiService = {
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
-      return await response.json();
+      const result = await response.json();
+      // New content was generated. Fetch the feed and this tab's insight
+      // topics once here and let the broadcast bring every other tab up to
+      // date. Tabs showing other topics keep their cached insights until they
+      // expire rather than each re-fetching.
+      publishContentUpdate({ type: 'generated-insights-invalidated' });
+      revalidateTradeNews(tradeNewsCache.count || 3).catch((error) => {
+        console.error("Error revalidating AI trade news:", error);
+      });
+      marketInsightTopics.forEach((topic) => {
+        fetchMarketInsights(topic)
+          .then((data) => publishContentUpdate({ type: 'market-insights', topic, data }))
+          .catch((error) => {
+            console.error("Error refreshing AI market insights:", error);
+          });
+      });
+      return result;
     } catch (error) {
       console.error("Error refreshing AI content:", error);
       return { error: "Failed to refresh AI content" };
@@ -60,23 +220,44 @@ const aiService = {
 
   async generateInsights(category = 'agriculture', count = 1) {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/ai/generate-insights`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({ category, count }),
+      return await generatedInsightsCache.get(['generate-insights', category, count], async () => {
+        const response = await request(`${API_BASE_URL}/api/ai/generate-insights`, {
+          policy: 'aiGenerate',
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({ category, count }),
+        });
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return await response.json();
       });
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      return await response.json();
     } catch (error) {
       console.error("Error generating AI insights:", error);
       return { error: "Failed to generate AI insights" };
     }
   },
 
+  // Calls listener with { type: 'trade-news', data },
+  // { type: 'market-insights', topic, data } or
+  // { type: 'generated-insights-invalidated' } whenever any tab receives new
+  // AI content. Returns an unsubscribe function.
+  subscribeToContentUpdates(listener) {
+    contentSubscribers.add(listener);
+    return () => {
+      contentSubscribers.delete(listener);
+    };
+  },
+
+  getCacheStats() {
+    return {
+      marketInsights: marketInsightsCache.getStats(),
+      generatedInsights: generatedInsightsCache.getStats(),
+    };
+  },
+
   formatNewsForDisplay(data) {
     if (!data || !data.articles) return [];
     return data.articles.map(article => ({
@@ -0,0 +1,100 @@
+import { request } from './httpClient';
+
+const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://bztrade.onrender.com';
+
+// Tokens without a readable exp claim are re-verified after this long.
+const DEFAULT_VERIFY_TTL_MS = 5 * 60 * 1000;
+
+// The only answers that mean the backend has rejected the token.
+const REJECTED_STATUSES = new Set([401, 403]);
+
+// token -> { valid, expiresAt } for tokens the backend has already answered
+// for, plus token -> Promise for verifications still in flight.
+const verifiedTokens = new Map();
+const pendingVerifications = new Map();
+// Tokens logged out in this session; rejected without asking the backend.
+const revokedTokens = new Set();
+
+const decodeTokenExpiry = (token) => {
+  try {
+    const payload = token.split('.')[1].replace(/-/g, '+').replace(/_/g, '/');
+    const { exp } = JSON.parse(atob(payload));
+    return typeof exp === 'number' ? exp * 1000 : null;
+  } catch {
+    return null;
+  }
+};
+
+const dropExpired = () => {
+  const now = Date.now();
+  for (const [token, entry] of verifiedTokens) {
+    if (entry.expiresAt <= now) verifiedTokens.delete(token);
+  }
+};
+
+export const getAdminToken = () => {
+  if (localStorage.getItem('adminAuthenticated') !== 'true') return null;
+  return localStorage.getItem('adminToken');
+};
+
+export const clearAdminSession = () => {
+  localStorage.removeItem('adminAuthenticated');
+  localStorage.removeItem('adminToken');
+  localStorage.removeItem('adminUser');
+};
+
+export const logoutAdmin = () => {
+  const token = localStorage.getItem('adminToken');
+  if (token) {
+    revokedTokens.add(token);
+    verifiedTokens.delete(token);
+  }
+  clearAdminSession();
+};
+
+// Resolves to false only when the backend rejects the token with 401/403.
+// Network errors and other failures resolve to true so an unreachable backend
+// does not lock admins out, but those answers are not cached.
+export const verifyAdminToken = async (token) => {
+  if (!token || revokedTokens.has(token)) return false;
+
+  const expiry = decodeTokenExpiry(token);
+  if (expiry !== null && expiry <= Date.now()) return false;
+
+  const cached = verifiedTokens.get(token);
+  if (cached && cached.expiresAt > Date.now()) return cached.valid;
+  if (pendingVerifications.has(token)) return pendingVerifications.get(token);
+
+  const verification = request(`${API_BASE_URL}/api/auth/verify-token`, {
+    policy: 'auth',
+    method: 'POST',
+    headers: {
+      'Authorization': `Bearer ${token}`,
+      'Content-Type': 'application/json',
+    },
+  })
+    .then((response) => {
+      const rejected = REJECTED_STATUSES.has(response.status);
+      // Rate limiting and server or proxy errors say nothing about the token
+      // itself, so they are treated like a network error.
+      if (!response.ok && !rejected) {
+        console.error(`Token verification failed: HTTP ${response.status}`);
+        return true;
+      }
+      dropExpired();
+      verifiedTokens.set(token, {
+        valid: !rejected,
+        expiresAt: expiry ?? Date.now() + DEFAULT_VERIFY_TTL_MS,
+      });
+      return !rejected;
+    })
+    .catch((error) => {
+      console.error('Token verification failed:', error);
+      return true;
+    })
+    .finally(() => {
+      pendingVerifications.delete(token);
+    });
+  pendingVerifications.set(token, verification);
+  return verification;
+};
@@ -0,0 +1,180 @@
+// Shared fetch wrapper for backend calls. Each call names a policy that sets
+// its timeout, retry budget, circuit breaker and concurrency limit, so a slow
+// AI provider cannot hang pages or crowd out auth requests.
+
+import { incrementCounter, observeLatency } from './metrics';
+
+const POLICIES = {
+  default: { timeoutMs: 10000, retries: 0 },
+  auth: { timeoutMs: 10000, retries: 0 },
+  aiStatus: { timeoutMs: 3000, retries: 0, breaker: 'ai' },
+  aiRead: { timeoutMs: 15000, retries: 2, breaker: 'ai' },
+  aiGenerate: { timeoutMs: 60000, retries: 0, breaker: 'ai', concurrency: 2 },
+};
+
+const BREAKER_FAILURE_THRESHOLD = 5;
+const BREAKER_COOLDOWN_MS = 30 * 1000;
+const RETRY_BASE_DELAY_MS = 250;
+const RETRYABLE_STATUSES = new Set([502, 503, 504]);
+
+export class CircuitOpenError extends Error {
+  constructor(name) {
+    super(`Circuit "${name}" is open`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+const breakers = new Map();
+const limiters = new Map();
+
+const getBreaker = (name) => {
+  if (!breakers.has(name)) {
+    breakers.set(name, { failures: 0, openedAt: 0, probing: false });
+  }
+  return breakers.get(name);
+};
+
+// True while requests are being rejected: during the cooldown, and while the
+// single half-open probe is still in flight.
+export const isCircuitOpen = (name) => {
+  const breaker = breakers.get(name);
+  if (!breaker || !breaker.openedAt) return false;
+  return breaker.probing || Date.now() - breaker.openedAt < BREAKER_COOLDOWN_MS;
+};
+
+const acquireBreaker = (name) => {
+  const breaker = getBreaker(name);
+  if (!breaker.openedAt) return;
+  // After the cooldown a single probe request is let through; everything else
+  // keeps failing fast until the probe settles.
+  if (isCircuitOpen(name)) {
+    throw new CircuitOpenError(name);
+  }
+  breaker.probing = true;
+};
+
+const settleBreaker = (name, ok) => {
+  const breaker = getBreaker(name);
+  breaker.probing = false;
+  if (ok) {
+    breaker.failures = 0;
+    breaker.openedAt = 0;
+    return;
+  }
+  breaker.failures += 1;
+  if (breaker.openedAt || breaker.failures >= BREAKER_FAILURE_THRESHOLD) {
+    breaker.openedAt = Date.now();
+  }
+};
+
+const acquireSlot = (name, concurrency) => {
+  if (!limiters.has(name)) {
+    limiters.set(name, { active: 0, queue: [] });
+  }
+  const limiter = limiters.get(name);
+  if (limiter.active < concurrency) {
+    limiter.active += 1;
+    return Promise.resolve(limiter);
+  }
+  return new Promise((resolve) => limiter.queue.push(() => resolve(limiter)));
+};
+
+const releaseSlot = (limiter) => {
+  const next = limiter.queue.shift();
+  if (next) {
+    next();
+  } else {
+    limiter.active -= 1;
+  }
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const routeOf = (url) => {
+  try {
+    return new URL(url, window.location.origin).pathname;
+  } catch {
+    return url;
+  }
+};
+
+const NULL_BODY_STATUSES = new Set([101, 103, 204, 205, 304]);
+
+// The body is read under the same timer as the headers, so a provider that
+// sends headers and then stalls cannot hang the caller's response.json().
+// API payloads are small JSON documents, so buffering them costs little.
+const fetchWithTimeout = async (url, options, timeoutMs) => {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), timeoutMs);
+  try {
+    const response = await fetch(url, { ...options, signal: controller.signal });
+    const body = await response.arrayBuffer();
+    return new Response(NULL_BODY_STATUSES.has(response.status) ? null : body, {
+      status: response.status,
+      statusText: response.statusText,
+      headers: response.headers,
+    });
+  } catch (error) {
+    if (error.name === 'AbortError') {
+      throw new Error(`Request to ${url} timed out after ${timeoutMs}ms`);
+    }
+    throw error;
+  } finally {
+    clearTimeout(timer);
+  }
+};
+
+// Returns the Response for any HTTP status, leaving status handling to the
+// caller. Throws on network errors, timeouts and open circuits.
+export const request = async (url, { policy = 'default', ...options } = {}) => {
+  const config = POLICIES[policy] || POLICIES.default;
+  const method = (options.method || 'GET').toUpperCase();
+  // Only idempotent reads are safe to replay.
+  const retries = method === 'GET' ? config.retries : 0;
+
+  const route = routeOf(url);
+  const queuedAt = performance.now();
+  const limiter = config.concurrency ? await acquireSlot(policy, config.concurrency) : null;
+  if (limiter) {
+    observeLatency('http_client_queue_wait_milliseconds', { policy }, performance.now() - queuedAt);
+  }
+  try {
+    for (let attempt = 0; ; attempt += 1) {
+      if (config.breaker) {
+        try {
+          acquireBreaker(config.breaker);
+        } catch (error) {
+          incrementCounter('http_client_circuit_open_total', { route });
+          throw error;
+        }
+      }
+      if (attempt > 0) incrementCounter('http_client_retries_total', { route });
+
+      let response = null;
+      let failure = null;
+      const startedAt = performance.now();
+      try {
+        response = await fetchWithTimeout(url, options, config.timeoutMs);
+      } catch (error) {
+        failure = error;
+      }
+      observeLatency('http_client_request_duration_milliseconds', {
+        route,
+        method,
+        status: failure ? 'error' : response.status,
+      }, performance.now() - startedAt);
+
+      const retryable = failure !== null || RETRYABLE_STATUSES.has(response.status);
+      if (config.breaker) settleBreaker(config.breaker, !retryable && response.status < 500);
+
+      if (!retryable || attempt >= retries) {
+        if (failure) throw failure;
+        return response;
+      }
+      // Full jitter keeps retries from a burst of clients from synchronising.
+      await sleep(Math.random() * RETRY_BASE_DELAY_MS * 2 ** attempt);
+    }
+  } finally {
+    if (limiter) releaseSlot(limiter);
+  }
+};
@@ -0,0 +1,86 @@
+// Lightweight in-memory instrumentation. Recording a sample is a bucket scan
+// over a fixed array, so it is cheap enough to leave on in production.
+// Inspect from the console with window.__BZTRADEWAVE_METRICS__.toPrometheusText().
+
+const LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000];
+
+const histograms = new Map();
+const counters = new Map();
+const gauges = new Map();
+
+const seriesKey = (name, labels) => JSON.stringify([name, labels]);
+
+const escapeLabelValue = (value) => String(value)
+  .replace(/\\/g, '\\\\')
+  .replace(/"/g, '\\"')
+  .replace(/\n/g, '\\n');
+
+const formatLabels = (labels, extra = {}) => {
+  const entries = Object.entries({ ...labels, ...extra });
+  if (!entries.length) return '';
+  return `{${entries.map(([key, value]) => `${key}="${escapeLabelValue(value)}"`).join(',')}}`;
+};
+
+export const observeLatency = (name, labels, durationMs) => {
+  const key = seriesKey(name, labels);
+  let histogram = histograms.get(key);
+  if (!histogram) {
+    histogram = { name, labels, buckets: new Array(LATENCY_BUCKETS_MS.length).fill(0), count: 0, sum: 0 };
+    histograms.set(key, histogram);
+  }
+  const index = LATENCY_BUCKETS_MS.findIndex((bound) => durationMs <= bound);
+  if (index !== -1) histogram.buckets[index] += 1;
+  histogram.count += 1;
+  histogram.sum += durationMs;
+};
+
+export const incrementCounter = (name, labels = {}) => {
+  const key = seriesKey(name, labels);
+  const counter = counters.get(key) || { name, labels, value: 0 };
+  counter.value += 1;
+  counters.set(key, counter);
+};
+
+export const setGauge = (name, labels, value) => {
+  gauges.set(seriesKey(name, labels), { name, labels, value });
+};
+
+// Records how long the page took to reach a startup milestone, measured from
+// navigation start.
+export const markStartup = (stage) => {
+  setGauge('app_startup_milliseconds', { stage }, performance.now());
+};
+
+export const toPrometheusText = () => {
+  const lines = [];
+  const typed = new Set();
+  const declare = (name, type) => {
+    if (typed.has(name)) return;
+    typed.add(name);
+    lines.push(`# TYPE ${name} ${type}`);
+  };
+
+  // Series of the same metric must be contiguous in the exposition format.
+  const byName = (series) => [...series.values()].sort((a, b) => a.name.localeCompare(b.name));
+
+  for (const { name, labels, buckets, count, sum } of byName(histograms)) {
+    declare(name, 'histogram');
+    let cumulative = 0;
+    LATENCY_BUCKETS_MS.forEach((bound, index) => {
+      cumulative += buckets[index];
+      lines.push(`${name}_bucket${formatLabels(labels, { le: bound })} ${cumulative}`);
+    });
+    lines.push(`${name}_bucket${formatLabels(labels, { le: '+Inf' })} ${count}`);
+    lines.push(`${name}_sum${formatLabels(labels)} ${sum.toFixed(3)}`);
+    lines.push(`${name}_count${formatLabels(labels)} ${count}`);
+  }
+  for (const { name, labels, value } of byName(counters)) {
+    declare(name, 'counter');
+    lines.push(`${name}${formatLabels(labels)} ${value}`);
+  }
+  for (const { name, labels, value } of byName(gauges)) {
+    declare(name, 'gauge');
+    lines.push(`${name}${formatLabels(labels)} ${Number(value).toFixed(3)}`);
+  }
+  return `${lines.join('\n')}\n`;
+};
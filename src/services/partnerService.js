@@ -0,0 +1,212 @@
+import { request } from './httpClient';
+
+const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://bztrade.onrender.com';
+
+// Applications that could not reach the backend are kept here and re-sent
+// later, so a flaky connection during a campaign does not lose submissions.
+const OUTBOX_KEY = 'partnerApplicationOutbox';
+// Fallback cross-tab claim for browsers without the Web Locks API. A claim
+// older than this is assumed to belong to a tab that closed mid-flush.
+const OUTBOX_CLAIM_KEY = 'partnerApplicationOutboxClaim';
+const OUTBOX_CLAIM_TTL_MS = 60 * 1000;
+
+// While the outbox has entries it is retried on a timer, backing off from the
+// base delay up to the max.
+const RETRY_BASE_DELAY_MS = 5 * 1000;
+const RETRY_MAX_DELAY_MS = 5 * 60 * 1000;
+
+// Registration is not idempotent, so only failures that mean the request did
+// not reach the application are queued for replay: network errors and gateway
+// answers. Even these can follow a commit (e.g. a 504 after the row was
+// written), so the backend must treat a repeated email as the same
+// application rather than create a second one.
+const REPLAYABLE_STATUSES = new Set([502, 503, 504]);
+
+const REQUIRED_FIELDS = [
+  'company_name',
+  'contact_name',
+  'email',
+  'phone',
+  'country',
+  'business_type',
+  'annual_revenue',
+  'experience',
+];
+
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+let flushing = null;
+let retryTimer = null;
+let retryDelay = RETRY_BASE_DELAY_MS;
+
+const readOutbox = () => {
+  try {
+    return JSON.parse(localStorage.getItem(OUTBOX_KEY)) || [];
+  } catch {
+    return [];
+  }
+};
+
+const writeOutbox = (entries) => {
+  if (entries.length) {
+    localStorage.setItem(OUTBOX_KEY, JSON.stringify(entries));
+  } else {
+    localStorage.removeItem(OUTBOX_KEY);
+  }
+};
+
+const newId = () => `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+
+// A resubmission from the same email replaces the queued one instead of
+// producing a duplicate application.
+const enqueue = (application) => {
+  const email = application.email.toLowerCase();
+  writeOutbox([
+    ...readOutbox().filter((entry) => entry.application.email.toLowerCase() !== email),
+    { id: newId(), application },
+  ]);
+};
+
+const dequeue = (id) => {
+  writeOutbox(readOutbox().filter((entry) => entry.id !== id));
+};
+
+// Runs task in at most one tab at a time, since the outbox is shared between
+// tabs. If another tab already holds the lock, it drains the outbox and this
+// call does nothing.
+const withOutboxLock = async (task) => {
+  if (navigator.locks) {
+    return navigator.locks.request(OUTBOX_KEY, { ifAvailable: true }, (lock) => (lock ? task() : null));
+  }
+
+  const claim = (() => {
+    try {
+      return JSON.parse(localStorage.getItem(OUTBOX_CLAIM_KEY));
+    } catch {
+      return null;
+    }
+  })();
+  if (claim && Date.now() - claim.claimedAt < OUTBOX_CLAIM_TTL_MS) return null;
+
+  const claimId = newId();
+  localStorage.setItem(OUTBOX_CLAIM_KEY, JSON.stringify({ id: claimId, claimedAt: Date.now() }));
+  if (JSON.parse(localStorage.getItem(OUTBOX_CLAIM_KEY))?.id !== claimId) return null;
+  try {
+    return await task();
+  } finally {
+    localStorage.removeItem(OUTBOX_CLAIM_KEY);
+  }
+};
+
+const toPayload = (formData) => ({
+  company_name: formData.companyName.trim(),
+  contact_name: formData.contactName.trim(),
+  email: formData.email.trim(),
+  phone: formData.phone.trim(),
+  country: formData.country.trim(),
+  business_type: formData.businessType,
+  annual_revenue: formData.annualRevenue,
+  experience: formData.experience,
+  interests: formData.interests,
+  message: formData.message,
+});
+
+const validate = (application) => {
+  const missing = REQUIRED_FIELDS.filter((field) => !application[field]);
+  if (missing.length) {
+    return `Please fill in all required fields (${missing.join(', ')}).`;
+  }
+  if (!EMAIL_PATTERN.test(application.email)) {
+    return 'Please enter a valid email address.';
+  }
+  return null;
+};
+
+const postApplication = (application) => request(`${API_BASE_URL}/api/auth/partner/register`, {
+  policy: 'auth',
+  method: 'POST',
+  headers: {
+    'Content-Type': 'application/json',
+  },
+  body: JSON.stringify(application),
+});
+
+const readError = async (response) => {
+  try {
+    const result = await response.json();
+    return result.error;
+  } catch {
+    return null;
+  }
+};
+
+const scheduleRetry = () => {
+  if (retryTimer || !readOutbox().length) return;
+  retryTimer = setTimeout(() => {
+    retryTimer = null;
+    flushPendingApplications();
+  }, retryDelay);
+  retryDelay = Math.min(retryDelay * 2, RETRY_MAX_DELAY_MS);
+};
+
+// Re-sends queued applications one at a time, re-reading the outbox so entries
+// queued mid-flush are picked up. Stops at the first replayable failure and
+// leaves the rest queued for the retry timer. Only the entry that was sent is
+// removed, so an application resubmitted meanwhile stays queued.
+export const flushPendingApplications = () => {
+  if (flushing) return flushing;
+
+  flushing = withOutboxLock(async () => {
+    for (let entry = readOutbox()[0]; entry; entry = readOutbox()[0]) {
+      try {
+        const response = await postApplication(entry.application);
+        if (REPLAYABLE_STATUSES.has(response.status)) break;
+        if (!response.ok) {
+          console.error('Queued partner application rejected:', await readError(response));
+        }
+      } catch {
+        break;
+      }
+      dequeue(entry.id);
+    }
+  }).finally(() => {
+    flushing = null;
+    if (readOutbox().length) {
+      scheduleRetry();
+    } else {
+      retryDelay = RETRY_BASE_DELAY_MS;
+    }
+  });
+  return flushing;
+};
+
+export const startApplicationOutbox = () => {
+  window.addEventListener('online', flushPendingApplications);
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'visible' && readOutbox().length) flushPendingApplications();
+  });
+  if (readOutbox().length) flushPendingApplications();
+};
+
+// Resolves to { ok: true }, { queued: true } when the backend could not be
+// reached, or { error } for an application that was rejected or failed in a
+// way that is not safe to replay.
+export const submitPartnerApplication = async (formData) => {
+  const application = toPayload(formData);
+  const validationError = validate(application);
+  if (validationError) return { error: validationError };
+
+  try {
+    const response = await postApplication(application);
+    if (response.ok) return { ok: true };
+    if (!REPLAYABLE_STATUSES.has(response.status)) {
+      return { error: await readError(response) || 'Failed to submit application. Please try again.' };
+    }
+  } catch (error) {
+    console.error('Error submitting partner application:', error);
+  }
+
+  enqueue(application);
+  scheduleRetry();
+  return { queued: true };
+};
@@ -0,0 +1,84 @@
+// In-memory LRU cache for idempotent API reads, keyed by request parameters.
+// Each entry expires ttlMs after it was stored, so clients that loaded at
+// different times do not all refetch at the same instant. Concurrent lookups for
+// the same key share one in-flight request instead of each hitting the backend.
+export const createRequestCache = ({ maxEntries = 50, ttlMs = 5 * 60 * 1000 } = {}) => {
+  const entries = new Map();
+  const inflight = new Map();
+  const stats = { hits: 0, misses: 0, coalesced: 0, evictions: 0, expirations: 0 };
+
+  const keyFor = (parts) => parts.join('|');
+
+  const isFresh = (entry) => Date.now() - entry.fetchedAt < ttlMs;
+
+  const dropExpired = () => {
+    for (const [key, entry] of entries) {
+      if (!isFresh(entry)) {
+        entries.delete(key);
+        stats.expirations += 1;
+      }
+    }
+  };
+
+  const remember = (key, value) => {
+    entries.delete(key);
+    entries.set(key, { value, fetchedAt: Date.now() });
+    if (entries.size > maxEntries) dropExpired();
+    while (entries.size > maxEntries) {
+      // Map iteration order is insertion order, so the first key is the LRU one.
+      entries.delete(entries.keys().next().value);
+      stats.evictions += 1;
+    }
+  };
+
+  return {
+    async get(parts, loader) {
+      const key = keyFor(parts);
+
+      const entry = entries.get(key);
+      if (entry) {
+        entries.delete(key);
+        if (isFresh(entry)) {
+          entries.set(key, entry);
+          stats.hits += 1;
+          return entry.value;
+        }
+        stats.expirations += 1;
+      }
+
+      if (inflight.has(key)) {
+        stats.coalesced += 1;
+        return inflight.get(key);
+      }
+
+      stats.misses += 1;
+      // Only successful loads are stored; a rejected loader is retried on the
+      // next lookup.
+      const promise = Promise.resolve()
+        .then(loader)
+        .then((value) => {
+          remember(key, value);
+          return value;
+        })
+        .finally(() => {
+          inflight.delete(key);
+        });
+      inflight.set(key, promise);
+      return promise;
+    },
+
+    // Stores a value fetched elsewhere, e.g. pushed from another tab.
+    set(parts, value) {
+      remember(keyFor(parts), value);
+    },
+
+    clear() {
+      entries.clear();
+    },
+
+    getStats() {
+      dropExpired();
+      return { ...stats, size: entries.size, inflight: inflight.size };
+    },
+  };
+};